@@ -6,15 +6,31 @@ Purpose: Enable CORS-free page title fetching for yohoo.html
 """
 
 from flask import Flask, request, jsonify
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import requests
+import errno
 import logging
+import logging.handlers
 import socket
 import sys
 import os
 import ipaddress
+import re
+import threading
+import time
+from collections import OrderedDict
+from html import unescape
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse, unquote, urljoin
 
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    # Environments created before lxml was added to the requirements
+    HTML_PARSER = 'html.parser'
+
 app = Flask(__name__)
 
 # Configuration (hardcoded)
@@ -22,10 +38,39 @@ PORT = 3001
 HOST = '127.0.0.1'
 TIMEOUT = 10
 MAX_REDIRECTS = 5
-ALLOWED_SCHEMES = ['http', 'https', 'file']
+REDIRECT_DRAIN_BYTES = 64 * 1024
+SUPPORTED_SCHEMES = ('http', 'https', 'file')
+ALLOWED_SCHEMES = frozenset(SUPPORTED_SCHEMES)
+HTTP_SCHEMES = frozenset({'http', 'https'})
+INVALID_SCHEME_ERROR = f"Invalid scheme. Use {', '.join(SUPPORTED_SCHEMES)}"
 MAX_URL_LENGTH = 2048
 MAX_RESPONSE_BYTES = 512 * 1024
 USER_AGENT = 'YohooTitleHelper/1.1'
+LOG_FILE = 'logs/proxy_server.log'
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+TITLE_CACHE_SIZE = 1024
+TITLE_CACHE_TTL = 60 * 60  # seconds
+TITLE_SCAN_CHARS = 64 * 1024
+TITLE_END_PATTERN = re.compile(rb'</title', re.IGNORECASE)
+HEAD_END_PATTERN = re.compile(rb'</head', re.IGNORECASE)
+# The fallback parse only needs the tags it searches; everything else is skipped
+TITLE_STRAINER = SoupStrainer(['title', 'meta'])
+# Checked in the same order as the BeautifulSoup fallback: <title>, og:title, twitter:title
+TITLE_OPEN_PATTERN = re.compile(r'<title\b[^>]*>', re.IGNORECASE)
+TITLE_TEXT_PATTERN = re.compile(r'(?P<title>[^<]*)</title\s*>', re.IGNORECASE)
+META_TITLE_PATTERNS = (
+    re.compile(
+        r'<meta\b[^>]*?\bproperty\s*=\s*["\']og:title["\'][^>]*?'
+        r'\bcontent\s*=\s*(?P<quote>["\'])(?P<title>.*?)(?P=quote)',
+        re.IGNORECASE
+    ),
+    re.compile(
+        r'<meta\b[^>]*?\bname\s*=\s*["\']twitter:title["\'][^>]*?'
+        r'\bcontent\s*=\s*(?P<quote>["\'])(?P<title>.*?)(?P=quote)',
+        re.IGNORECASE
+    ),
+)
 ALLOWED_ORIGINS = {
     'null',
     'http://localhost',
@@ -34,6 +79,28 @@ ALLOWED_ORIGINS = {
 }
 
 
+def create_http_session() -> requests.Session:
+    """
+    Create the shared session used for all page fetches
+    Pooled keep-alive connections let repeat hosts skip the TCP/TLS handshake.
+    Cookies are never stored on the session; fetch_http_title tracks them per fetch.
+    """
+    session = requests.Session()
+    session.headers['User-Agent'] = USER_AGENT
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+http_session = create_http_session()
+
+# Successful http(s) title lookups: cache key -> (title, expires_at), oldest first
+_title_cache = OrderedDict()
+_title_cache_lock = threading.Lock()
+
+
 def add_cors_headers(response):
     """Allow Yohoo pages to call the localhost helper from browser JavaScript."""
     origin = request.headers.get('Origin')
@@ -64,15 +131,20 @@ def origin_allowed() -> bool:
 def check_port_available(port: int) -> bool:
     """
     Check if port is available for binding
+    Sets SO_REUSEADDR like the Werkzeug server does, so sockets left in
+    TIME_WAIT by a quick restart are not reported as in use
     Returns: True if available, False if in use
     """
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    try:
-        sock.bind(('127.0.0.1', port))
-        sock.close()
-        return True
-    except OSError:
-        return False
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((HOST, port))
+        except OSError as e:
+            if e.errno == errno.EADDRINUSE:
+                return False
+            raise
+
+    return True
 
 
 def validate_url(url: str) -> tuple:
@@ -92,13 +164,13 @@ def validate_url(url: str) -> tuple:
         return False, "Invalid URL format"
     
     if parsed.scheme not in ALLOWED_SCHEMES:
-        return False, f"Invalid scheme. Use {', '.join(ALLOWED_SCHEMES)}"
+        return False, INVALID_SCHEME_ERROR
     
     # Validate http/https URLs
-    if parsed.scheme in ['http', 'https'] and not parsed.netloc:
+    if parsed.scheme in HTTP_SCHEMES and not parsed.netloc:
         return False, "Invalid URL format"
 
-    if parsed.scheme in ['http', 'https']:
+    if parsed.scheme in HTTP_SCHEMES:
         is_safe, error = validate_public_http_target(parsed.hostname)
         if not is_safe:
             return False, error
@@ -135,12 +207,45 @@ def validate_public_http_target(hostname: str) -> tuple:
     return True, None
 
 
+def extract_title_fast(html: str) -> str:
+    """
+    Extract title with precompiled regexes over the start of the document
+    Only the first <title> counts; if it is empty, og:title and twitter:title are tried
+    Returns: title string or None if the fast path cannot decide
+    """
+    head = html[:TITLE_SCAN_CHARS]
+
+    open_match = TITLE_OPEN_PATTERN.search(head)
+    if open_match:
+        text_match = TITLE_TEXT_PATTERN.match(head, open_match.end())
+        if not text_match:
+            # Unterminated or nested markup: leave it to the parser
+            return None
+        title = unescape(text_match.group('title')).strip()
+        if title:
+            return title
+
+    for pattern in META_TITLE_PATTERNS:
+        match = pattern.search(head)
+        if match:
+            title = unescape(match.group('title')).strip()
+            if title:
+                return title
+
+    return None
+
+
 def extract_title(html: str) -> str:
     """
     Extract <title> from HTML, with fallbacks
     Returns: title string or None
     """
-    soup = BeautifulSoup(html, 'html.parser')
+    # Fast path: most pages put the title near the top of <head>
+    title = extract_title_fast(html)
+    if title:
+        return title
+
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=TITLE_STRAINER)
     
     # Method 1: <title> tag
     title_tag = soup.find('title')
@@ -196,7 +301,8 @@ def fetch_http_title(url: str) -> tuple:
     Returns: (title, error)
     """
     try:
-        session = requests.Session()
+        # Cookies set during this fetch's redirect chain, and only this fetch's
+        cookies = requests.cookies.RequestsCookieJar()
         current_url = url
         response = None
 
@@ -205,19 +311,25 @@ def fetch_http_title(url: str) -> tuple:
             if not is_valid:
                 return None, validation_error
 
-            response = session.get(
+            response = http_session.get(
                 current_url,
                 timeout=TIMEOUT,
                 allow_redirects=False,
-                headers={'User-Agent': USER_AGENT},
+                cookies=cookies,
                 stream=True
             )
+            cookies.update(response.cookies)
 
             if response.is_redirect:
                 location = response.headers.get('Location')
                 if not location:
                     return None, "Redirect without Location header"
                 current_url = urljoin(current_url, location)
+                # Discard small redirect bodies undecoded so the connection goes
+                # back to the pool instead of being closed
+                content_length = response.headers.get('Content-Length', '')
+                if content_length.isdigit() and int(content_length) <= REDIRECT_DRAIN_BYTES:
+                    response.raw.drain_conn()
                 response.close()
                 continue
 
@@ -232,13 +344,27 @@ def fetch_http_title(url: str) -> tuple:
 
         chunks = []
         total_bytes = 0
+        title_closed = False
         for chunk in response.iter_content(chunk_size=16384, decode_unicode=False):
             if not chunk:
                 continue
+            # Include the previous chunk's tail in case the closing tag straddles chunks
+            window = (chunks[-1][-7:] if chunks else b'') + chunk
             chunks.append(chunk)
             total_bytes += len(chunk)
             if total_bytes >= MAX_RESPONSE_BYTES:
                 break
+            # Nothing after </head> can supply the title
+            if HEAD_END_PATTERN.search(window):
+                break
+            # Stop downloading once the first title is complete and usable;
+            # an empty one means og:title/twitter:title may still follow
+            title_closed = title_closed or bool(TITLE_END_PATTERN.search(window))
+            if title_closed and total_bytes <= TITLE_SCAN_CHARS:
+                partial = b''.join(chunks).decode(response.encoding or 'utf-8', errors='replace')
+                if extract_title_fast(partial):
+                    break
+        response.close()
 
         # Extract title
         encoding = response.encoding or response.apparent_encoding or 'utf-8'
@@ -260,6 +386,34 @@ def fetch_http_title(url: str) -> tuple:
         return None, f"Request error: {str(e)}"
 
 
+def get_cached_title(key: str) -> str:
+    """
+    Look up a cached title, dropping it if expired
+    Returns: title string or None
+    """
+    with _title_cache_lock:
+        entry = _title_cache.get(key)
+        if entry is None:
+            return None
+
+        title, expires_at = entry
+        if expires_at < time.monotonic():
+            del _title_cache[key]
+            return None
+
+        _title_cache.move_to_end(key)
+        return title
+
+
+def cache_title(key: str, title: str) -> None:
+    """Store a fetched title, evicting the least recently used entries past TITLE_CACHE_SIZE"""
+    with _title_cache_lock:
+        _title_cache[key] = (title, time.monotonic() + TITLE_CACHE_TTL)
+        _title_cache.move_to_end(key)
+        while len(_title_cache) > TITLE_CACHE_SIZE:
+            _title_cache.popitem(last=False)
+
+
 def fetch_page_title(url: str) -> tuple:
     """
     Main function to fetch title from any supported URL type
@@ -269,8 +423,18 @@ def fetch_page_title(url: str) -> tuple:
     
     if parsed.scheme == 'file':
         return fetch_file_title(url)
-    else:
-        return fetch_http_title(url)
+
+    # The fragment never reaches the server, so it does not change the title
+    cache_key = parsed._replace(fragment='').geturl()
+    title = get_cached_title(cache_key)
+    if title:
+        return title, None
+
+    title, error = fetch_http_title(url)
+    if title:
+        cache_title(cache_key, title)
+
+    return title, error
 
 
 @app.route('/fetch-title', methods=['GET', 'OPTIONS'])
@@ -341,7 +505,12 @@ if __name__ == '__main__':
         level=logging.INFO,
         format='[%(asctime)s] %(levelname)s: %(message)s',
         handlers=[
-            logging.FileHandler('logs/proxy_server.log'),
+            logging.handlers.RotatingFileHandler(
+                LOG_FILE,
+                maxBytes=LOG_MAX_BYTES,
+                backupCount=LOG_BACKUP_COUNT,
+                delay=True
+            ),
             logging.StreamHandler()
         ]
     )
@@ -356,7 +525,8 @@ if __name__ == '__main__':
     
     # Start server
     print(f"\n✅ Starting Yohoo Proxy Server on http://{HOST}:{PORT}")
-    print(f"📝 Logging to: logs/proxy_server.log")
+    print(f"📝 Logging to: {LOG_FILE}")
     print("⏹️  Press CTRL+C to quit\n")
     
-    app.run(host=HOST, port=PORT, debug=False)
+    # One thread per request: a slow page fetch must not block other lookups
+    app.run(host=HOST, port=PORT, debug=False, threaded=True)
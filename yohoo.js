@@ -85,36 +85,55 @@ updateTime();
 setInterval(updateTime, 60000);
 
 // Search functionality
+const SEARCH_DEBOUNCE_MS = 200;
 const searchBox = document.getElementById('searchBox');
+let searchTimer = null;
 
-searchBox.addEventListener('input', (e) => {
-    const searchTerm = e.target.value.toLowerCase().trim();
+// Live collections stay current as links and subcategories move, without re-querying
+const linkItems = document.getElementsByClassName('link-item');
+const subcategoryElements = document.getElementsByClassName('subcategory');
+
+// Lowercased link text, cached on the element so keystrokes skip re-lowercasing
+function linkSearchText(link) {
+    if (link.dataset.search === undefined) {
+        link.dataset.search = link.querySelector('.link-text').textContent.toLowerCase();
+    }
+    return link.dataset.search;
+}
+
+function handleSearch() {
+    clearTimeout(searchTimer);
+    const searchTerm = searchBox.value.toLowerCase().trim();
 
     if (searchTerm === '') {
-        document.querySelectorAll('.subcategory').forEach(cat => cat.classList.remove('hidden'));
-        document.querySelectorAll('.link-item').forEach(link => link.classList.remove('hidden'));
+        for (const cat of subcategoryElements) cat.classList.remove('hidden');
+        for (const link of linkItems) link.classList.remove('hidden');
         return;
     }
 
     // Filter links
-    document.querySelectorAll('.link-item').forEach(link => {
-        const text = link.querySelector('.link-text').textContent.toLowerCase();
-        if (text.includes(searchTerm)) {
+    for (const link of linkItems) {
+        if (linkSearchText(link).includes(searchTerm)) {
             link.classList.remove('hidden');
         } else {
             link.classList.add('hidden');
         }
-    });
+    }
 
     // Hide subcategories with no visible links
-    document.querySelectorAll('.subcategory').forEach(subcategory => {
-        const visibleLinks = subcategory.querySelectorAll('.link-item:not(.hidden)');
-        if (visibleLinks.length === 0) {
-            subcategory.classList.add('hidden');
-        } else {
+    for (const subcategory of subcategoryElements) {
+        if (subcategory.querySelector('.link-item:not(.hidden)')) {
             subcategory.classList.remove('hidden');
+        } else {
+            subcategory.classList.add('hidden');
         }
-    });
+    }
+}
+
+// Debounce typing so fast input does not rescan every link per keystroke
+searchBox.addEventListener('input', () => {
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(handleSearch, SEARCH_DEBOUNCE_MS);
 });
 
 // Keyboard shortcuts
@@ -124,9 +143,13 @@ document.addEventListener('keydown', (e) => {
         searchBox.focus();
     }
 
+    if (e.key === 'Enter' && document.activeElement === searchBox) {
+        handleSearch();
+    }
+
     if (e.key === 'Escape' && document.activeElement === searchBox) {
         searchBox.value = '';
-        searchBox.dispatchEvent(new Event('input'));
+        handleSearch();
         searchBox.blur();
     }
 });
@@ -200,9 +223,16 @@ function applyLinkAssignments(assignments) {
     let movedCount = 0;
     let notFoundCount = 0;
 
+    // Index links by URL in one DOM pass instead of rescanning per assignment
+    const linksByUrl = new Map();
+    for (const l of linkItems) {
+        if (!linksByUrl.has(l.dataset.url)) {
+            linksByUrl.set(l.dataset.url, l);
+        }
+    }
+
     Object.entries(assignments).forEach(([url, targetId]) => {
-        const links = document.querySelectorAll('.link-item');
-        const link = Array.from(links).find(l => l.dataset.url === url);
+        const link = linksByUrl.get(url);
 
         if (!link) {
             notFoundCount++;
@@ -228,6 +258,9 @@ function applyLinkAssignments(assignments) {
 }
 
 function restoreCustomLinks(customLinks, assignments) {
+    // Collect links per target list, then insert each list's batch in one append
+    const batches = new Map();
+
     customLinks.forEach(linkData => {
         const newLink = document.createElement('a');
         newLink.href = linkData.url;
@@ -242,31 +275,29 @@ function restoreCustomLinks(customLinks, assignments) {
             <span class="delete-icon" onclick="event.preventDefault(); deleteLink(this.parentElement);">🗑️</span>
         `;
 
-        // Add event listeners
-        newLink.addEventListener('mousedown', handleMouseDown);
-        newLink.addEventListener('dragstart', handleDragStart);
-        newLink.addEventListener('dragend', handleDragEnd);
-        newLink.addEventListener('click', handleLinkClick);
-
         // Find target container
         const targetId = assignments[linkData.url];
         if (targetId) {
             const targetContainer = document.querySelector(`[data-subcategory="${targetId}"] .links-list`);
             if (targetContainer) {
-                targetContainer.appendChild(newLink);
+                if (!batches.has(targetContainer)) {
+                    batches.set(targetContainer, document.createDocumentFragment());
+                }
+                batches.get(targetContainer).appendChild(newLink);
             }
         }
     });
+
+    batches.forEach((fragment, targetContainer) => targetContainer.appendChild(fragment));
 }
 
 function loadCustomLayout() {
     log('Loading custom layout from localStorage');
 
-    const originalCount = document.querySelectorAll('.link-item').length;
-    document.querySelectorAll('.link-item').forEach(link => {
+    for (const link of linkItems) {
         link.setAttribute('data-original', 'true');
-    });
-    log(`Marked ${originalCount} original links`);
+    }
+    log(`Marked ${linkItems.length} original links`);
 
     const stored = localStorage.getItem(STORAGE_KEY);
     if (stored) {
@@ -310,44 +341,61 @@ function loadCustomLayout() {
 // Drag and Drop for links
 let isDragging = false;
 let dragStartPos = null;
+// Single element currently highlighted during a drag, so cleanup need not scan the document
+let dragOverList = null;
+let subcategoryDropTarget = null;
 
-function setupDragAndDrop() {
-    // Make all link items draggable
-    document.querySelectorAll('.link-item').forEach(link => {
-        link.addEventListener('mousedown', handleMouseDown);
-        link.addEventListener('dragstart', handleDragStart);
-        link.addEventListener('dragend', handleDragEnd);
-        link.addEventListener('click', handleLinkClick);
-    });
+function setDragOverList(list) {
+    if (dragOverList && dragOverList !== list) {
+        dragOverList.classList.remove('drag-over');
+    }
+    dragOverList = list;
+    if (list) {
+        list.classList.add('drag-over');
+    }
+}
 
-    // Make all link containers drop targets
-    document.querySelectorAll('.links-list').forEach(container => {
-        container.addEventListener('dragover', handleDragOver);
-        container.addEventListener('drop', handleDrop);
-        container.addEventListener('dragleave', handleDragLeave);
-    });
+function setSubcategoryDropTarget(subcategory) {
+    if (subcategoryDropTarget && subcategoryDropTarget !== subcategory) {
+        subcategoryDropTarget.style.borderLeft = '';
+        subcategoryDropTarget.style.borderRight = '';
+    }
+    subcategoryDropTarget = subcategory;
+}
 
-    // Make subcategories draggable
-    setupSubcategoryDragAndDrop();
-}
-
-function setupSubcategoryDragAndDrop() {
-    document.querySelectorAll('.subcategory').forEach(subcategory => {
-        // Make subcategory draggable, but only from the header
-        subcategory.setAttribute('draggable', 'false'); // Not draggable by default
-        
-        const header = subcategory.querySelector('.subcategory-header');
-        if (header) {
-            // Make the header the drag handle
-            header.style.cursor = 'grab';
-            header.setAttribute('draggable', 'true');
-            header.addEventListener('dragstart', handleSubcategoryDragStart);
-            header.addEventListener('dragend', handleSubcategoryDragEnd);
+// Route an event to `handler` with `this` bound to the closest ancestor matching `selector`
+function delegate(selector, handler) {
+    return function (e) {
+        const target = e.target instanceof Element ? e.target.closest(selector) : null;
+        if (target) {
+            handler.call(target, e);
         }
-        
-        subcategory.addEventListener('dragover', handleSubcategoryDragOver);
-        subcategory.addEventListener('drop', handleSubcategoryDrop);
-        subcategory.addEventListener('dragleave', handleSubcategoryDragLeave);
+    };
+}
+
+function setupDragAndDrop() {
+    // One delegated listener per event type covers every link, list and subcategory,
+    // including links added later by restore/undelete/external drops
+    document.addEventListener('mousedown', delegate('.link-item', handleMouseDown));
+    document.addEventListener('click', delegate('.link-item', handleLinkClick));
+    document.addEventListener('dragstart', delegate('.link-item', handleDragStart));
+    document.addEventListener('dragend', delegate('.link-item', handleDragEnd));
+
+    // Link and subcategory handlers guard on draggedSubcategory, so both can see every event
+    document.addEventListener('dragover', delegate('.links-list', handleDragOver));
+    document.addEventListener('drop', delegate('.links-list', handleDrop));
+    document.addEventListener('dragleave', delegate('.links-list', handleDragLeave));
+
+    // Subcategories are dragged by their header only
+    document.addEventListener('dragstart', delegate('.subcategory-header', handleSubcategoryDragStart));
+    document.addEventListener('dragend', delegate('.subcategory-header', handleSubcategoryDragEnd));
+    document.addEventListener('dragover', delegate('.subcategory', handleSubcategoryDragOver));
+    document.addEventListener('drop', delegate('.subcategory', handleSubcategoryDrop));
+    document.addEventListener('dragleave', delegate('.subcategory', handleSubcategoryDragLeave));
+
+    document.querySelectorAll('.subcategory-header').forEach(header => {
+        header.style.cursor = 'grab';
+        header.setAttribute('draggable', 'true');
     });
 }
 
@@ -377,11 +425,8 @@ function handleSubcategoryDragEnd(e) {
     this.style.cursor = 'grab';
     draggedSubcategory = null;
     
-    // Clean up any lingering visual indicators
-    document.querySelectorAll('.subcategory').forEach(s => {
-        s.style.borderLeft = '';
-        s.style.borderRight = '';
-    });
+    // Clean up any lingering visual indicator
+    setSubcategoryDropTarget(null);
 }
 
 function handleSubcategoryDragOver(e) {
@@ -396,6 +441,7 @@ function handleSubcategoryDragOver(e) {
     const midpoint = rect.left + rect.width / 2;
     const insertBefore = e.clientX < midpoint;
 
+    setSubcategoryDropTarget(this);
     this.style.borderLeft = insertBefore ? '3px solid #c4a3ff' : '';
     this.style.borderRight = !insertBefore ? '3px solid #c4a3ff' : '';
 
@@ -500,9 +546,7 @@ function handleDragStart(e) {
 function handleDragEnd(e) {
     log(`LINK DRAG END: ${this.dataset.title || this.textContent}`, 'info');
     this.classList.remove('dragging');
-    document.querySelectorAll('.drag-over').forEach(el => {
-        el.classList.remove('drag-over');
-    });
+    setDragOverList(null);
     draggedElement = null;
     isDragging = false;
 }
@@ -521,7 +565,7 @@ function handleDragOver(e) {
     
     // Set dropEffect based on whether this is an internal or external drag
     e.dataTransfer.dropEffect = draggedElement ? 'move' : 'copy';
-    this.classList.add('drag-over');
+    setDragOverList(this);
     
     const subcategory = this.closest('.subcategory');
     const subcatName = subcategory?.dataset.subcategory || 'unknown';
@@ -531,8 +575,8 @@ function handleDragOver(e) {
 }
 
 function handleDragLeave(e) {
-    if (e.target === this) {
-        this.classList.remove('drag-over');
+    if (e.target === this && dragOverList === this) {
+        setDragOverList(null);
     }
 }
 
@@ -552,7 +596,7 @@ function handleDrop(e) {
         e.preventDefault();
     }
 
-    this.classList.remove('drag-over');
+    setDragOverList(null);
 
     if (draggedElement) {
         // Internal link drop - move link to new location
@@ -623,6 +667,7 @@ function handleDrop(e) {
                             if (pageTitle) {
                                 newLink.dataset.title = pageTitle;
                                 newLink.querySelector('.link-text').textContent = pageTitle;
+                                delete newLink.dataset.search;
                                 log(`Fetched title: "${pageTitle}"`);
                                 saveCustomLayout();
                             }
@@ -655,11 +700,6 @@ function handleDrop(e) {
                 }
             }
 
-            newLink.addEventListener('mousedown', handleMouseDown);
-            newLink.addEventListener('dragstart', handleDragStart);
-            newLink.addEventListener('dragend', handleDragEnd);
-            newLink.addEventListener('click', handleLinkClick);
-
             this.appendChild(newLink);
             log(`Added new link: "${newLink.dataset.title}"`);
             saveCustomLayout();
@@ -690,7 +730,8 @@ function deleteLink(linkElement) {
     });
 
     linkElement.remove();
-    updateTrashDisplay();
+    appendTrashRow(deletedLinks[deletedLinks.length - 1]);
+    updateTrashCount();
     saveCustomLayout();
 }
 
@@ -724,37 +765,74 @@ function undeleteLink(index) {
             <span class="delete-icon" onclick="event.preventDefault(); deleteLink(this.parentElement);">🗑️</span>
         `;
 
-        newLink.addEventListener('mousedown', handleMouseDown);
-        newLink.addEventListener('dragstart', handleDragStart);
-        newLink.addEventListener('dragend', handleDragEnd);
-        newLink.addEventListener('click', handleLinkClick);
-
         targetContainer.appendChild(newLink);
     }
 
     deletedLinks.splice(index, 1);
-    updateTrashDisplay();
+    trashRows.splice(index, 1)[0]?.remove();
+    updateTrashCount();
     saveCustomLayout();
 }
 
-function updateTrashDisplay() {
-    const trashLinks = document.getElementById('trashLinks');
-    const trashCount = document.getElementById('trashCount');
+// Trash rows, kept parallel to deletedLinks so deletes/restores touch a single node
+const trashRows = [];
+let trashEmptyEl = null;
+
+function createTrashRow(link) {
+    const row = document.createElement('div');
+    row.className = 'trash-item';
+
+    const title = document.createElement('span');
+    title.className = 'trash-item-link';
+    title.textContent = link.title;
 
-    trashCount.textContent = `(${deletedLinks.length})`;
+    const restoreBtn = document.createElement('button');
+    restoreBtn.className = 'undelete-btn';
+    restoreBtn.textContent = 'Restore';
+
+    row.append(title, restoreBtn);
+    return row;
+}
+
+function appendTrashRow(link) {
+    const row = createTrashRow(link);
+    trashRows.push(row);
+    document.getElementById('trashLinks').appendChild(row);
+}
+
+function updateTrashCount() {
+    document.getElementById('trashCount').textContent = `(${deletedLinks.length})`;
+
+    if (!trashEmptyEl) {
+        trashEmptyEl = document.createElement('div');
+        trashEmptyEl.style.cssText = 'color: #8e72b8; font-size: 11px; padding: 8px;';
+        trashEmptyEl.textContent = 'No deleted links';
+    }
 
     if (deletedLinks.length === 0) {
-        trashLinks.innerHTML = '<div style="color: #8e72b8; font-size: 11px; padding: 8px;">No deleted links</div>';
+        document.getElementById('trashLinks').appendChild(trashEmptyEl);
     } else {
-        trashLinks.innerHTML = deletedLinks.map((link, index) => `
-            <div class="trash-item">
-                <span class="trash-item-link">${link.title}</span>
-                <button class="undelete-btn" onclick="undeleteLink(${index})">Restore</button>
-            </div>
-        `).join('');
+        trashEmptyEl.remove();
     }
 }
 
+// Full rebuild, used when deletedLinks is replaced wholesale (e.g. on load)
+function updateTrashDisplay() {
+    const trashLinks = document.getElementById('trashLinks');
+
+    trashLinks.textContent = '';
+    trashRows.length = 0;
+    deletedLinks.forEach(appendTrashRow);
+    updateTrashCount();
+}
+
+document.getElementById('trashLinks').addEventListener('click', (e) => {
+    const restoreBtn = e.target.closest('.undelete-btn');
+    if (restoreBtn) {
+        undeleteLink(trashRows.indexOf(restoreBtn.parentElement));
+    }
+});
+
 // Trash toggle
 document.getElementById('trashHeader').addEventListener('click', () => {
     const content = document.getElementById('trashContent');